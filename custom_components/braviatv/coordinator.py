@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Awaitable, Callable, Coroutine, Iterable
 from datetime import datetime, timedelta
 from functools import wraps
@@ -38,6 +39,14 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 SCAN_INTERVAL: Final = timedelta(seconds=10)
+REQUEST_REFRESH_COOLDOWN: Final = 2.0
+URI_SCHEMES: Final = frozenset({"extInput", "tv"})
+APP_URI_PREFIX: Final = "com.sony.dtv."
+UPDATE_ERROR_PRIORITY: Final = (
+    (BraviaConnectionError, BraviaConnectionTimeout, BraviaTurnedOff),
+    BraviaNotFound,
+    BraviaError,
+)
 
 type BraviaTVConfigEntry = ConfigEntry[BraviaTVCoordinator]
 
@@ -55,7 +64,14 @@ def catch_braviatv_errors[_BraviaTVCoordinatorT: BraviaTVCoordinator, **_P](
             await func(self, *args, **kwargs)
         except BraviaError as err:
             _LOGGER.error("Command error: %s", err)
-        await self.async_request_refresh()
+            if not self.connected:
+                # the regular poll reconnects, an extra refresh gains nothing
+                return
+        self.hass.async_create_background_task(
+            self.async_request_refresh(),
+            name="bravia post-command refresh",
+            eager_start=True,
+        )
     return wrapper
 
 
@@ -80,7 +96,21 @@ class BraviaTVCoordinator(DataUpdateCoordinator[None]):
         self.system_info: dict[str, str] = {}
         self.source: str | None = None
         self.source_list: list[str] = []
+        self._source_list_set: set[str] = set()
         self.source_map: dict[str, dict] = {}
+        self.source_map_type: dict[str, SourceType] = {}
+        self._sources_pending: set[SourceType] = set(SourceType)
+        self._sources_sig: dict[SourceType, int] = {}
+        self._exact_idx: dict[SourceType, dict[str, str]] = {
+            source_type: {} for source_type in SourceType
+        }
+        self._channel_num_idx: dict[int, str] = {}
+        self._src_uris: dict[SourceType, list[str]] = {
+            source_type: [] for source_type in SourceType
+        }
+        self._src_titles_lc: dict[SourceType, list[str]] = {
+            source_type: [] for source_type in SourceType
+        }
         self.media_title: str | None = None
         self.media_channel: str | None = None
         self.media_content_id: str | None = None
@@ -89,12 +119,15 @@ class BraviaTVCoordinator(DataUpdateCoordinator[None]):
         self.media_duration: int | None = None
         self.media_position: int | None = None
         self.media_position_updated_at: datetime | None = None
+        self._start_dt_cache: tuple[str, datetime] | None = None
+        self._last_playing_info: dict[str, Any] | None = None
         self.volume_level: float | None = None
         self.volume_target: str | None = None
         self.volume_muted = False
         self.is_on = False
         self.connected = False
         self.skipped_updates = 0
+        self._command_list: dict[str, str] | None = None
 
         super().__init__(
             hass,
@@ -103,10 +136,26 @@ class BraviaTVCoordinator(DataUpdateCoordinator[None]):
             name=DOMAIN,
             update_interval=SCAN_INTERVAL,
             request_refresh_debouncer=Debouncer(
-                hass, _LOGGER, cooldown=1.0, immediate=False
+                hass, _LOGGER, cooldown=REQUEST_REFRESH_COOLDOWN, immediate=False
             ),
         )
 
+    def _sources_clear(
+        self, source_type: SourceType, add_to_list: bool = False
+    ) -> None:
+        if add_to_list:
+            self.source_list = []
+            self._source_list_set = set()
+        for uri in self._src_uris[source_type]:
+            if self.source_map_type.get(uri) == source_type:
+                del self.source_map[uri]
+                del self.source_map_type[uri]
+        self._src_uris[source_type] = []
+        self._src_titles_lc[source_type] = []
+        self._exact_idx[source_type] = {}
+        if source_type == SourceType.CHANNEL:
+            self._channel_num_idx = {}
+
     def _sources_extend(
         self,
         sources: list[dict],
@@ -115,17 +164,32 @@ class BraviaTVCoordinator(DataUpdateCoordinator[None]):
         sort_by: str | None = None,
     ) -> None:
         if sort_by:
-            sources = sorted(sources, key=lambda d: d.get(sort_by, ""))
+            sources.sort(key=lambda d: d.get(sort_by) or "")
+        use_labels = self.enable_user_labels
+        exact_idx = self._exact_idx[source_type]
+        src_uris = self._src_uris[source_type]
+        src_titles_lc = self._src_titles_lc[source_type]
         for item in sources:
             title = item.get("title")
-            if self.enable_user_labels and (label := item.get("label")):
+            if use_labels and (label := item.get("label")):
                 title = label
             uri = item.get("uri")
             if not title or not uri:
                 continue
-            self.source_map[uri] = {**item, "type": source_type}
-            if add_to_list and title not in self.source_list:
+            self.source_map[uri] = item
+            self.source_map_type[uri] = source_type
+            title_lc = title.lower()
+            exact_idx.setdefault(title_lc, uri)
+            src_uris.append(uri)
+            src_titles_lc.append(title_lc)
+            if source_type == SourceType.CHANNEL and (num := item.get("dispNum")):
+                try:
+                    self._channel_num_idx.setdefault(int(num), uri)
+                except ValueError:
+                    pass
+            if add_to_list and title not in self._source_list_set:
                 self.source_list.append(title)
+                self._source_list_set.add(title)
 
     async def _async_update_data(self) -> None:
         try:
@@ -140,23 +204,44 @@ class BraviaTVCoordinator(DataUpdateCoordinator[None]):
                             nickname=self.nickname,
                         )
                     self.connected = True
+                    self._command_list = None
                 except BraviaAuthError as err:
                     raise ConfigEntryAuthFailed from err
 
-            power_status = await self.client.get_power_status()
+            if self.system_info:
+                power_status = await self.client.get_power_status()
+            else:
+                power_status, _ = await asyncio.gather(
+                    self.client.get_power_status(), self.async_update_system_info()
+                )
             self.is_on = power_status == "active"
             self.skipped_updates = 0
 
-            if not self.system_info:
-                self.system_info = await self.client.get_system_info()
-
             if not self.is_on:
                 return
 
-            if not self.source_map:
+            # playing info needs the source labels, so sources are loaded first
+            if self._sources_pending:
                 await self.async_update_sources()
-            await self.async_update_volume()
-            await self.async_update_playing()
+            try:
+                async with asyncio.TaskGroup() as tg:
+                    tg.create_task(self.async_update_volume())
+                    tg.create_task(self.async_update_playing())
+            except ExceptionGroup as err:
+                # re-raise the most telling failure for the handlers below
+                exc = next(
+                    (
+                        candidate
+                        for error_types in UPDATE_ERROR_PRIORITY
+                        for candidate in err.exceptions
+                        if isinstance(candidate, error_types)
+                    ),
+                    err.exceptions[0],
+                )
+                for other in err.exceptions:
+                    if other is not exc:
+                        _LOGGER.debug("Concurrent update also failed: %s", other)
+                raise exc from None
 
         except BraviaNotFound as err:
             if self.skipped_updates < 10:
@@ -174,6 +259,9 @@ class BraviaTVCoordinator(DataUpdateCoordinator[None]):
             self.connected = False
             raise UpdateFailed(f"Error communicating with device: {err}") from err
 
+    async def async_update_system_info(self) -> None:
+        self.system_info = await self.client.get_system_info()
+
     async def async_update_volume(self) -> None:
         volume_info = await self.client.get_volume_info()
         if (volume_level := volume_info.get("volume")) is not None:
@@ -181,8 +269,28 @@ class BraviaTVCoordinator(DataUpdateCoordinator[None]):
             self.volume_muted = volume_info.get("mute", False)
             self.volume_target = volume_info.get("target")
 
+    def _update_media_position(self, start_datetime_str: str | None) -> None:
+        if not start_datetime_str:
+            self.media_position = None
+            self.media_position_updated_at = None
+            return
+        if self._start_dt_cache and self._start_dt_cache[0] == start_datetime_str:
+            start_datetime = self._start_dt_cache[1]
+        else:
+            start_datetime = datetime.fromisoformat(start_datetime_str)
+            self._start_dt_cache = (start_datetime_str, start_datetime)
+        current_datetime = datetime.now(tz=start_datetime.tzinfo)
+        self.media_position = int((current_datetime - start_datetime).total_seconds())
+        self.media_position_updated_at = current_datetime
+
     async def async_update_playing(self) -> None:
         playing_info = await self.client.get_playing_info()
+        # nothing but the position moves while the same content keeps playing
+        if playing_info == self._last_playing_info:
+            self._update_media_position(playing_info.get("startDateTime"))
+            return
+        self._last_playing_info = playing_info
+
         self.media_title = playing_info.get("title")
         self.media_uri = playing_info.get("uri")
         self.media_duration = playing_info.get("durationSec")
@@ -190,15 +298,7 @@ class BraviaTVCoordinator(DataUpdateCoordinator[None]):
         self.media_content_id = None
         self.media_content_type = None
         self.source = None
-
-        if start_datetime := playing_info.get("startDateTime"):
-            start_datetime = datetime.fromisoformat(start_datetime)
-            current_datetime = datetime.now().replace(tzinfo=start_datetime.tzinfo)
-            self.media_position = int((current_datetime - start_datetime).total_seconds())
-            self.media_position_updated_at = datetime.now()
-        else:
-            self.media_position = None
-            self.media_position_updated_at = None
+        self._update_media_position(playing_info.get("startDateTime"))
 
         if not playing_info:
             self.media_title = "Smart TV"
@@ -209,8 +309,10 @@ class BraviaTVCoordinator(DataUpdateCoordinator[None]):
         if self.media_uri:
             self.media_content_id = self.media_uri
 
+        scheme = self.media_uri.split(":", 1)[0] if self.media_uri else ""
+
         # handle HDMI / external inputs
-        if self.media_uri and self.media_uri.startswith("extInput"):
+        if scheme == "extInput":
             # try to get user label from source_map
             label = None
             if self.enable_user_labels and self.media_uri in self.source_map:
@@ -225,7 +327,7 @@ class BraviaTVCoordinator(DataUpdateCoordinator[None]):
                 self.media_title = self.source
 
         # handle TV channels
-        elif self.media_uri and self.media_uri.startswith("tv"):
+        elif scheme == "tv":
             self.media_content_id = playing_info.get("dispNum")
             self.media_title = (
                 playing_info.get("programTitle") or self.media_content_id
@@ -245,16 +347,62 @@ class BraviaTVCoordinator(DataUpdateCoordinator[None]):
                 self.source = title
                 self.media_title = title
 
-    async def async_update_sources(self) -> None:
-        self.source_list = []
-        self.source_map = {}
-
-        inputs = await self.client.get_external_status()
-        self._sources_extend(inputs, SourceType.INPUT, add_to_list=True)
-        apps = await self.client.get_app_list()
-        self._sources_extend(apps, SourceType.APP, sort_by="title")
-        channels = await self.client.get_content_list_all("tv")
-        self._sources_extend(channels, SourceType.CHANNEL)
+    async def async_update_sources(self, force: bool = False) -> None:
+        pending = [
+            (source_type, fetch, add_to_list, sort_by)
+            for source_type, fetch, add_to_list, sort_by in (
+                (SourceType.INPUT, self.client.get_external_status, True, None),
+                (SourceType.APP, self.client.get_app_list, False, "title"),
+                (
+                    SourceType.CHANNEL,
+                    lambda: self.client.get_content_list_all("tv"),
+                    False,
+                    None,
+                ),
+            )
+            if force or source_type in self._sources_pending
+        ]
+        results = await asyncio.gather(
+            *(fetch() for _, fetch, _, _ in pending), return_exceptions=True
+        )
+        rebuilt = False
+        for (source_type, _, add_to_list, sort_by), result in zip(pending, results):
+            if isinstance(result, BraviaError):
+                _LOGGER.warning(
+                    "Unable to fetch %s sources, retrying on next update: %s",
+                    source_type,
+                    result,
+                )
+                continue
+            if isinstance(result, BaseException):
+                raise result
+            # the browser refetches on every open, skip types the TV left unchanged
+            sources_sig = hash(
+                tuple(
+                    (
+                        d.get("uri"),
+                        d.get("title"),
+                        d.get("label"),
+                        d.get("dispNum"),
+                        d.get("icon"),
+                    )
+                    for d in result
+                )
+            )
+            if self._sources_sig.get(source_type) == sources_sig:
+                continue
+            self._sources_sig[source_type] = sources_sig
+            rebuilt = True
+            self._sources_clear(source_type, add_to_list)
+            self._sources_extend(result, source_type, add_to_list, sort_by)
+            # an empty list is common while the TV boots, keep polling for it
+            if self._src_uris[source_type]:
+                self._sources_pending.discard(source_type)
+            else:
+                self._sources_pending.add(source_type)
+        if rebuilt:
+            # labels from the new sources must be applied to the current media
+            self._last_playing_info = None
 
     async def async_source_start(self, uri: str, source_type: SourceType | str) -> None:
         if source_type == SourceType.APP:
@@ -265,26 +413,26 @@ class BraviaTVCoordinator(DataUpdateCoordinator[None]):
     async def async_source_find(
         self, query: str, source_type: SourceType | str
     ) -> None:
-        if query.startswith(("extInput:", "tv:", "com.sony.dtv.")):
+        scheme, sep, _ = query.partition(":")
+        if (sep and scheme in URI_SCHEMES) or query.startswith(APP_URI_PREFIX):
             return await self.async_source_start(query, source_type)
-        coarse_uri = None
         is_numeric_search = source_type == SourceType.CHANNEL and query.isnumeric()
-        for uri, item in self.source_map.items():
-            if item["type"] == source_type:
-                if is_numeric_search:
-                    num = item.get("dispNum")
-                    if num and int(query) == int(num):
-                        return await self.async_source_start(uri, source_type)
-                else:
-                    title = item.get("title")
-                    if self.enable_user_labels and (label := item.get("label")):
-                        title = label
-                    if query.lower() == title.lower():
-                        return await self.async_source_start(uri, source_type)
-                    if query.lower() in title.lower():
-                        coarse_uri = uri
-        if coarse_uri:
-            return await self.async_source_start(coarse_uri, source_type)
+        query_int = int(query) if is_numeric_search else None
+        query_lc = query.lower()
+        if query_int is not None:
+            if uri := self._channel_num_idx.get(query_int):
+                return await self.async_source_start(uri, source_type)
+        else:
+            uri = self._exact_idx.get(source_type, {}).get(query_lc)
+            if uri is None:
+                for title_lc, item_uri in zip(
+                    self._src_titles_lc.get(source_type, []),
+                    self._src_uris.get(source_type, []),
+                ):
+                    if query_lc in title_lc:
+                        uri = item_uri
+            if uri:
+                return await self.async_source_start(uri, source_type)
         raise ValueError(f"Not found {source_type}: {query}")
 
     @catch_braviatv_errors
@@ -351,16 +499,21 @@ class BraviaTVCoordinator(DataUpdateCoordinator[None]):
 
     @catch_braviatv_errors
     async def async_send_command(self, command: Iterable[str], repeats: int) -> None:
-        for _ in range(repeats):
-            for cmd in command:
-                response = await self.client.send_command(cmd)
-                if not response:
-                    commands = await self.client.get_command_list()
-                    _LOGGER.error(
-                        "Unsupported command: %s, available: %s",
-                        cmd,
-                        ", ".join(commands.keys()),
-                    )
+        unsupported: set[str] = set()
+        # IRCC codes must reach the TV in order, so they are sent one by one
+        for cmd in list(command) * repeats:
+            if cmd in unsupported:
+                continue
+            if await self.client.send_command(cmd):
+                continue
+            unsupported.add(cmd)
+            if self._command_list is None:
+                self._command_list = await self.client.get_command_list()
+            _LOGGER.error(
+                "Unsupported command: %s, available: %s",
+                cmd,
+                ", ".join(self._command_list.keys()),
+            )
 
     @catch_braviatv_errors
     async def async_reboot_device(self) -> None:
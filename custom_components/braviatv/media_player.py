@@ -152,7 +152,7 @@ class BraviaTVMediaPlayer(BraviaTVEntity, MediaPlayerEntity):
     ) -> BrowseMedia:
         """Browse apps and channels."""
         if not media_content_id:
-            await self.coordinator.async_update_sources()
+            await self.coordinator.async_update_sources(force=True)
             return await self.async_browse_media_root()
 
         path = media_content_id.partition("/")
@@ -195,7 +195,7 @@ class BraviaTVMediaPlayer(BraviaTVEntity, MediaPlayerEntity):
                     ),
                 )
                 for uri, item in self.coordinator.source_map.items()
-                if item["type"] == SourceType.APP
+                if self.coordinator.source_map_type[uri] == SourceType.APP
             ]
         else:
             children = None
@@ -224,7 +224,7 @@ class BraviaTVMediaPlayer(BraviaTVEntity, MediaPlayerEntity):
                     can_expand=False,
                 )
                 for uri, item in self.coordinator.source_map.items()
-                if item["type"] == SourceType.CHANNEL
+                if self.coordinator.source_map_type[uri] == SourceType.CHANNEL
             ]
         else:
             children = None